@@ -14,14 +14,64 @@ Usage:
 """
 
 import os
+import queue
 import re
 import threading
+import time
+import traceback
+from concurrent.futures import CancelledError, ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from google.oauth2.service_account import Credentials
 from google.auth.transport.requests import Request
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to requests' stdlib json decoding.
+    orjson = None
+
+MAX_DOWNLOAD_WORKERS = 16
+STREAM_CHUNK_SIZE = 1024 * 1024
+# Studies are downloaded one at a time: each already saturates its own download pools, and a
+# single running study owns the progress bar.
+UI_DOWNLOAD_WORKERS = 1
+LOG_FLUSH_INTERVAL_MS = 100
+LOG_FLUSH_MAX_LINES = 500
+PROGRESS_UPDATE_INTERVAL_SECONDS = 0.1
+RANGED_DOWNLOAD_THRESHOLD = 16 * 1024 * 1024
+UNCACHED_WRITE_THRESHOLD = 16 * 1024 * 1024
+RANGED_DOWNLOAD_PARTS = 8
+RANGED_DOWNLOAD_WORKERS = (os.cpu_count() or 1) * 2
+ADAPTIVE_INITIAL_CONCURRENCY = 8
+ADAPTIVE_MIN_CONCURRENCY = 2
+ADAPTIVE_CONCURRENCY_STEP = 2
+ADAPTIVE_WINDOW = 50
+ADAPTIVE_LATENCY_SPIKE_FACTOR = 2.0
+HTTP_RETRIES = 5
+THROTTLE_STATUSES = (429, 503)
+
+# Instance GETs only add DICOM-specific headers; authorization comes from the session.
+# Listings keep requests' default Accept-Encoding, but DICOM bodies are binary, so they are
+# requested without content encoding.
+INSTANCE_HEADERS = {
+    "Accept": "application/dicom; transfer-syntax=*",
+    "Accept-Encoding": "identity",
+}
+
+# Credentials are shared by every Downloader created from the same key file, so token
+# refreshes are serialised across all of them.
+_TOKEN_LOCK = threading.Lock()
+
+_CONTENT_RANGE_RE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+
+_GCP_PATH_RE = re.compile(
+    r"projects/(?P<project_id>[^/]+)/locations/(?P<location>[^/]+)/"
+    r"datasets/(?P<dataset>[^/]+)/dicomStores/(?P<datastore>[^/]+)"
+)
+
 class DicomDownloaderUI:
     """
     A class to represent the DICOM Downloader UI.
@@ -34,6 +84,10 @@ class DicomDownloaderUI:
         output_folder_entry (tk.Entry): Entry widget for the output folder path.
         progress (ttk.Progressbar): Progress bar widget to show download progress.
         log_text (tk.Text): Text widget to log messages.
+        log_queue (queue.Queue): Queue of log lines produced by worker threads, flushed to log_text on the Tk thread.
+        executor (ThreadPoolExecutor): Persistent worker pool that runs queued download tasks one at a time.
+        credentials (dict): Service account credentials loaded so far, keyed by key file path.
+        downloaders (set): Downloaders that are queued or running, cancelled when the window closes.
     """
 
     def __init__(self, root):
@@ -64,7 +118,7 @@ class DicomDownloaderUI:
         self.output_folder_entry.grid(row=3, column=1)
         tk.Button(root, text="Browse", command=lambda: self.browse_folder(self.output_folder_entry)).grid(row=3, column=2)
 
-        self.progress = ttk.Progressbar(root, orient=tk.HORIZONTAL, length=400, mode='indeterminate')
+        self.progress = ttk.Progressbar(root, orient=tk.HORIZONTAL, length=400, mode='determinate')
         self.progress.grid(row=4, column=0, columnspan=3, pady=10)
         self.progress["value"] = 0  # Initialize progress to 0
 
@@ -72,9 +126,18 @@ class DicomDownloaderUI:
 
         self.log_text = tk.Text(root, height=10, width=70)
         self.log_text.grid(row=6, column=0, columnspan=3, pady=10)
+        self.log_queue = queue.Queue()
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self._drain_log)
 
         tk.Label(root, text="© jtihin.gregory@trenser.com").grid(row=7, column=0, columnspan=3, pady=10)
 
+        self.executor = ThreadPoolExecutor(max_workers=UI_DOWNLOAD_WORKERS)
+        self.credentials = {}
+        self.downloaders = set()
+        self._downloaders_lock = threading.Lock()
+        self._closing = False
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
     def browse_file(self, entry):
         """
         Open a file dialog to browse for a file and insert the selected file path into the entry widget.
@@ -101,22 +164,106 @@ class DicomDownloaderUI:
 
     def start_download(self):
         """
-        Start the download process by creating a Downloader instance and running it in a separate thread.
+        Start the download process by creating a Downloader instance and submitting it to the worker pool.
+        """
+        study_id = self.study_id_entry.get()
+        output_folder = self.output_folder_entry.get()
+        datastore_path = self.dicom_store_url_entry.get()
+        if not _GCP_PATH_RE.match(datastore_path.strip()):
+            messagebox.showerror("Invalid DICOM Store URL", f"Unrecognised DICOM store path: {datastore_path}")
+            return
+        try:
+            credentials = self.get_credentials(self.service_account_entry.get())
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Invalid Service Account", str(e))
+            return
+        downloader = Downloader(credentials, datastore_path, self.progress, self.log_queue)
+        with self._downloaders_lock:
+            if not self.downloaders:
+                self.progress["value"] = 0
+            self.downloaders.add(downloader)
+        future = self.executor.submit(self.run_download, downloader, study_id, output_folder)
+        future.add_done_callback(lambda f: self._download_done(downloader, f))
+
+    def get_credentials(self, service_account_json_path):
         """
-        self.progress.start()  # Start the progress bar animation
-        downloader = Downloader(self.service_account_entry.get(), self.dicom_store_url_entry.get(), self.progress, self.log_text)
-        download_thread = threading.Thread(target=self.run_download, args=(downloader,))
-        download_thread.start()
+        Load the credentials for a service account key file, reusing them across downloads so
+        their access token is only refreshed when it nears expiry.
+
+        Args:
+            service_account_json_path (str): The path to the service account JSON file.
+
+        Returns:
+            Credentials: The credentials for the Google Cloud Healthcare API.
+        """
+        credentials = self.credentials.get(service_account_json_path)
+        if credentials is None:
+            credentials = Credentials.from_service_account_file(
+                service_account_json_path,
+                scopes=["https://www.googleapis.com/auth/cloud-healthcare"]
+            )
+            self.credentials[service_account_json_path] = credentials
+        return credentials
 
-    def run_download(self, downloader):
+    def run_download(self, downloader, study_id, output_folder):
         """
-        Run the download process and stop the progress bar animation when done.
+        Run the download process.
 
         Args:
             downloader (Downloader): The Downloader instance to run.
+            study_id (str): The study ID to download DICOM files for.
+            output_folder (str): The folder to save the downloaded DICOM files to.
+        """
+        downloader.download(study_id, output_folder)
+
+    def _download_done(self, downloader, future):
         """
-        downloader.download(self.study_id_entry.get(), self.output_folder_entry.get())
-        self.progress.stop()  # Stop the progress bar animation
+        Forget a finished download and report any error it did not handle itself.
+        Usually runs on the worker thread that completed the future, but runs on the Tk thread
+        when the future was cancelled by on_close or had finished before the callback was
+        attached, so it must neither block nor touch widgets directly.
+
+        Args:
+            downloader (Downloader): The Downloader instance that finished.
+            future (Future): The future of its download task.
+        """
+        with self._downloaders_lock:
+            self.downloaders.discard(downloader)
+        if self._closing or future.cancelled() or future.exception() is None:
+            return
+        error = future.exception()
+        traceback.print_exception(type(error), error, error.__traceback__)
+        try:
+            self.root.after(0, messagebox.showerror, "Download Failed", f"{type(error).__name__}: {error}")
+        except (RuntimeError, tk.TclError):
+            pass  # The window was closed while the download was failing.
+
+    def _drain_log(self):
+        """
+        Flush queued log lines to the log widget in a single insert and reschedule itself.
+        """
+        lines = []
+        try:
+            while len(lines) < LOG_FLUSH_MAX_LINES:
+                lines.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if lines:
+            self.log_text.insert(tk.END, "".join(lines))
+            self.log_text.see(tk.END)
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self._drain_log)
+
+    def on_close(self):
+        """
+        Cancel queued and running downloads, shut down the worker pool and close the window.
+        """
+        self._closing = True
+        with self._downloaders_lock:
+            downloaders = list(self.downloaders)
+        for downloader in downloaders:
+            downloader.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
 
 class Downloader:
     """
@@ -125,31 +272,45 @@ class Downloader:
     Attributes:
         credentials (Credentials): The credentials for the Google Cloud Healthcare API.
         progress_bar (ttk.Progressbar): The progress bar widget to update during the download.
-        log_text (tk.Text): The text widget to log messages.
+        log_queue (queue.Queue): The queue to post log messages to.
         project_id (str): The Google Cloud project ID.
         location (str): The Google Cloud location.
         dataset (str): The Google Cloud dataset.
         datastore (str): The Google Cloud datastore.
         base_url (str): The base URL for the Google Cloud Healthcare API.
+        session (requests.Session): The pooled HTTP session shared by all requests.
+        limiter (_AdaptiveLimiter): Bounds the number of instance connections in flight, including byte ranges.
     """
 
-    def __init__(self, service_account_json_path, datastore_path, progress_bar, log_text):
+    def __init__(self, credentials, datastore_path, progress_bar, log_queue):
         """
         Initialize the Downloader.
 
         Args:
-            service_account_json_path (str): The path to the service account JSON file.
+            credentials (Credentials): The credentials for the Google Cloud Healthcare API.
             datastore_path (str): The DICOM store URL.
             progress_bar (ttk.Progressbar): The progress bar widget to update during the download.
-            log_text (tk.Text): The text widget to log messages.
+            log_queue (queue.Queue): The queue to post log messages to.
         """
-        self.credentials = Credentials.from_service_account_file(
-            service_account_json_path,
-            scopes=["https://www.googleapis.com/auth/cloud-healthcare"]
-        )
+        self.credentials = credentials
         self.extract_gcp_info(datastore_path)
         self.progress_bar = progress_bar
-        self.log_text = log_text
+        self.log_queue = log_queue
+        self._auth_request = Request()
+        self._cancelled = threading.Event()
+        self.limiter = _AdaptiveLimiter(
+            ADAPTIVE_INITIAL_CONCURRENCY, ADAPTIVE_MIN_CONCURRENCY, MAX_DOWNLOAD_WORKERS
+        )
+        self.session = requests.Session()
+        # Rate-limit responses are retried with backoff (honouring Retry-After) rather than
+        # aborting the study; the limiter is told about them so it can back off too.
+        retries = Retry(
+            total=HTTP_RETRIES, backoff_factor=1, status_forcelist=THROTTLE_STATUSES,
+            allowed_methods=frozenset({"GET"}), raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=50, pool_maxsize=100, max_retries=retries)
+        self.session.mount("https://", adapter)
+        self.session.auth = self._authorize
 
     def extract_gcp_info(self, resource_path: str):
         """
@@ -157,24 +318,25 @@ class Downloader:
 
         Args:
             resource_path (str): The resource path containing project, location, dataset, and datastore information.
+
+        Raises:
+            ValueError: If the resource path is not a DICOM store path.
         """
-        resource_path = resource_path.strip()
-        pattern = (r"projects/(?P<project_id>[^/]+)/locations/(?P<location>[^/]+)/"
-                   r"datasets/(?P<dataset>[^/]+)/dicomStores/(?P<datastore>[^/]+)")
-        
-        match = re.match(pattern, resource_path)
-        if match:
-            self.project_id = match.group("project_id")
-            self.location = match.group("location")
-            self.dataset = match.group("dataset")
-            self.datastore = match.group("datastore")
-            self.base_url = (
-                f"https://healthcare.googleapis.com/v1/projects/"
-                f"{self.project_id}/"
-                f"locations/{self.location}/"
-                f"datasets/{self.dataset}/"
-                f"dicomStores/{self.datastore}"
-            )
+        match = _GCP_PATH_RE.match(resource_path.strip())
+        if not match:
+            raise ValueError(f"Unrecognised DICOM store path: {resource_path}")
+
+        self.project_id = match.group("project_id")
+        self.location = match.group("location")
+        self.dataset = match.group("dataset")
+        self.datastore = match.group("datastore")
+        self.base_url = (
+            f"https://healthcare.googleapis.com/v1/projects/"
+            f"{self.project_id}/"
+            f"locations/{self.location}/"
+            f"datasets/{self.dataset}/"
+            f"dicomStores/{self.datastore}"
+        )
     
     def download(self, study_id, output_folder):
         """
@@ -184,84 +346,583 @@ class Downloader:
             study_id (str): The study ID to download DICOM files for.
             output_folder (str): The folder to save the downloaded DICOM files to.
         """
+        self._schedule(self._update_progress, 0, 0)
         try:
-            access_token = self._get_access_tocken()
-            headers = {
-                "Authorization": f"Bearer {access_token}"
-            }
             study_url = f"{self.base_url}/dicomWeb/studies/{str(study_id).strip()}/series"
 
-            series_response = requests.get(study_url, headers=headers, timeout=1000)
+            series_response = self.session.get(study_url, timeout=1000)
             series_response.raise_for_status()
-            series_json = series_response.json()
-            print(str(series_json))
-            series_list = series_response.json()
+            series_list = self._parse_json(series_response)
             
             study_folder = os.path.join(output_folder, str(study_id).strip())
             os.makedirs(study_folder, exist_ok=True)
             
-            total_series = len(series_list)
-            self.progress_bar["maximum"] = total_series
-            
-            for i, series in enumerate(series_list):
-                series_id = series["0020000E"]["Value"][0]
-                series_folder = os.path.join(study_folder, series_id)
-                os.makedirs(series_folder, exist_ok=True)
-                
-                series_url = f"{study_url}/{series_id}/instances"
-                instances_response = requests.get(series_url, headers=headers, timeout=1000)
-                instances_response.raise_for_status()
-                instances_list = instances_response.json()
-                count = 0
-                for instance in instances_list:
-                    count += 1
-                    sop_instance_uid = instance["00080018"]["Value"][0]
-                    instance_url = f"{series_url}/{sop_instance_uid}"
-                    instance_headers = {
-                        "Authorization": f"Bearer {access_token}",
-                        "Accept": "application/dicom; transfer-syntax=*"
-                    }
-                    instance_response = requests.get(instance_url, headers=instance_headers, timeout=1000)
-                    instance_response.raise_for_status()
-                    if instance_response.status_code == 200:
-                        file_name = f'{sop_instance_uid}.dcm'
-                        output_file_path = os.path.join(series_folder, file_name)
-                        os.makedirs(os.path.dirname(output_file_path), exist_ok=True)
-                        with open(output_file_path, "wb") as file:
-                            file.write(instance_response.content)
-                        log_message = f"{count}: {sop_instance_uid}\n"
-                        self.log_text.insert(tk.END, log_message)
-                        self.log_text.see(tk.END)
-                        print(f"DICOM file downloaded successfully: {output_file_path}")
-                    else:
-                        raise requests.exceptions.HTTPError(
-                            f"Failed to download DICOM file. Status code: "
-                            f"{instance_response.status_code}"
-                        )
-                    
-                    dicom_file = os.path.join(series_folder, f"{sop_instance_uid}.dcm")
-                    with open(dicom_file, "wb") as f:
-                        f.write(instance_response.content)
-                
-                self.progress_bar["value"] = i + 1
-                self.progress_bar.update_idletasks()
-
-            messagebox.showinfo("Success", "DICOM download completed successfully!")
+            # Instance listings are fetched up front on one pool and each listing is handed
+            # to the download pool as soon as it arrives, so listing latency overlaps downloads.
+            # Every future posts itself to one queue when done, so each completion is handled
+            # in constant time however many downloads are outstanding.
+            completions = queue.Queue()
+            with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as listing_executor, \
+                    ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as instance_executor, \
+                    ThreadPoolExecutor(max_workers=RANGED_DOWNLOAD_WORKERS) as range_executor:
+                listing_futures = {}
+                for series in series_list:
+                    series_id = series["0020000E"]["Value"][0]
+                    series_folder = os.path.join(study_folder, series_id)
+                    os.makedirs(series_folder, exist_ok=True)
+                    series_url = f"{study_url}/{series_id}/instances"
+                    future = listing_executor.submit(self._list_instances, series_url)
+                    listing_futures[future] = (series_url, series_folder + os.sep)
+                    future.add_done_callback(completions.put)
+
+                try:
+                    outstanding = len(listing_futures)
+                    listed = completed = 0
+                    last_update = 0.0
+                    while outstanding:
+                        future = completions.get()
+                        outstanding -= 1
+                        if future in listing_futures:
+                            series_url, series_prefix = listing_futures[future]
+                            instances_list = future.result()
+                            listed += len(instances_list)
+                            for instance in instances_list:
+                                sop_instance_uid = instance["00080018"]["Value"][0]
+                                instance_future = instance_executor.submit(
+                                    self._download_instance, range_executor, series_url, sop_instance_uid, series_prefix
+                                )
+                                instance_future.add_done_callback(completions.put)
+                                outstanding += 1
+                        else:
+                            sop_instance_uid = future.result()
+                            completed += 1
+                            self.log_queue.put(f"{completed}: {sop_instance_uid}\n")
+                        # The bar's maximum grows as listings arrive; redraws are throttled.
+                        now = time.monotonic()
+                        if not outstanding or now - last_update >= PROGRESS_UPDATE_INTERVAL_SECONDS:
+                            last_update = now
+                            self._schedule(self._update_progress, completed, listed)
+                except BaseException:
+                    # Drop queued work so a failure is reported without waiting for every pending download.
+                    for executor in (listing_executor, instance_executor, range_executor):
+                        executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+
+            self._schedule(messagebox.showinfo, "Success", "DICOM download completed successfully!")
         except (requests.exceptions.RequestException, OSError) as e:
-            messagebox.showerror("Download Failed", str(e))
+            self._schedule(messagebox.showerror, "Download Failed", str(e))
+        except CancelledError:
+            if not self._cancelled.is_set():
+                raise
+        finally:
+            self.session.close()
         
+    def cancel(self):
+        """
+        Cancel the download: queued and running tasks stop before their next request, and no
+        further widget updates are made.
+        """
+        # Tasks are not cancelled through their executors, which only drop queued work: the flag
+        # also stops running tasks before their next request, and download() sees the resulting
+        # CancelledError arrive on its completion queue like any other finished task.
+        self._cancelled.set()
+
+    def _schedule(self, callback, *args):
+        """
+        Run a widget update on the Tk thread unless the download was cancelled.
+
+        Args:
+            callback (callable): The function to call on the Tk thread.
+            *args: The arguments to pass to the callback.
+        """
+        if self._cancelled.is_set():
+            return
+        try:
+            self.progress_bar.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            pass  # The window has been destroyed.
+
+    def _list_instances(self, series_url):
+        """
+        List the DICOM instances of a series.
+
+        Args:
+            series_url (str): The DICOMweb URL of the series' instances.
+
+        Returns:
+            list: The instance metadata returned by the DICOMweb API.
+        """
+        if self._cancelled.is_set():
+            raise CancelledError()
+        instances_response = self.session.get(series_url, timeout=1000)
+        instances_response.raise_for_status()
+        return self._parse_json(instances_response)
+
+    def _parse_json(self, response):
+        """
+        Decode a JSON response body, using orjson when it is installed.
+
+        Args:
+            response (requests.Response): The response to decode.
+
+        Returns:
+            list: The decoded DICOMweb JSON.
+
+        Raises:
+            requests.exceptions.JSONDecodeError: If the body is not valid JSON.
+        """
+        if orjson is not None:
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError as e:
+                # Match Response.json() so callers handle both decoders as a RequestException.
+                raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+        return response.json()
+
+    def _download_instance(self, range_executor, series_url, sop_instance_uid, series_prefix):
+        """
+        Download a single DICOM instance and write it to the series folder.
+
+        Instances larger than RANGED_DOWNLOAD_THRESHOLD are fetched as parallel byte ranges
+        when the server supports them. The body is written to a ``.part`` file that is renamed
+        once complete, so an existing ``.dcm`` file is always whole and is skipped on re-runs.
+
+        Args:
+            range_executor (ThreadPoolExecutor): The executor to submit byte-range downloads to.
+            series_url (str): The DICOMweb URL of the series' instances.
+            sop_instance_uid (str): The SOP instance UID to download.
+            series_prefix (str): The folder to save the DICOM file to, ending with a path separator.
+
+        Returns:
+            str: The SOP instance UID of the downloaded instance.
+        """
+        if self._cancelled.is_set():
+            raise CancelledError()
+        instance_url = f"{series_url}/{sop_instance_uid}"
+        output_file_path = f"{series_prefix}{sop_instance_uid}.dcm"
+        if os.path.exists(output_file_path) and os.path.getsize(output_file_path) > 0:
+            return sop_instance_uid
+
+        self.limiter.acquire()
+        try:
+            if self._cancelled.is_set():
+                raise CancelledError()
+            latency, size = self._fetch_instance(range_executor, instance_url, output_file_path)
+        finally:
+            self.limiter.release()
+        self.limiter.record(latency, size)
+        if size >= UNCACHED_WRITE_THRESHOLD:
+            # Syncing a large file can take a while, so it is done without holding a permit.
+            self._release_page_cache(output_file_path)
+        print(f"DICOM file downloaded successfully: {output_file_path}")
+        return sop_instance_uid
+
+    def _fetch_instance(self, range_executor, instance_url, output_file_path):
+        """
+        Fetch an instance body into a ``.part`` file and rename it to its final path.
+
+        The first request asks for the first RANGED_DOWNLOAD_THRESHOLD bytes. Smaller instances
+        are complete after that one round trip; for larger ones the probe is kept as the first
+        range and the rest is fetched as parallel byte ranges.
+
+        Args:
+            range_executor (ThreadPoolExecutor): The executor to submit byte-range downloads to.
+            instance_url (str): The DICOMweb URL of the instance.
+            output_file_path (str): The final path of the DICOM file.
+
+        Returns:
+            tuple: The time to the first response's headers in seconds, and the instance size in bytes.
+        """
+        partial_file_path = f"{output_file_path}.part"
+        latency = None
+        downloaded = False
+        if hasattr(os, "pwrite"):
+            probe_headers = {**INSTANCE_HEADERS, "Range": f"bytes=0-{RANGED_DOWNLOAD_THRESHOLD - 1}"}
+            with self.session.get(instance_url, headers=probe_headers, stream=True, timeout=1000) as probe_response:
+                latency = probe_response.elapsed.total_seconds()
+                self._note_throttling(probe_response)
+                content_range = self._parse_content_range(probe_response)
+                if probe_response.status_code == 200:
+                    # The server ignored the Range header and sent the whole instance.
+                    size = self._write_response(probe_response, partial_file_path)
+                    downloaded = True
+                elif content_range is not None and content_range[0] == 0:
+                    _, probe_end, size = content_range
+                    if probe_end + 1 == size:
+                        self._write_response(probe_response, partial_file_path)
+                        downloaded = True
+                    else:
+                        downloaded = self._download_ranged(
+                            range_executor, instance_url, partial_file_path, probe_response, probe_end, size
+                        )
+                elif probe_response.status_code >= 500:
+                    probe_response.raise_for_status()
+                # Any other answer (416 for an empty instance, or a 4xx from a store that rejects
+                # ranges) falls back to a plain GET, which still fails for a missing instance.
+
+        if not downloaded:
+            with self.session.get(instance_url, headers=INSTANCE_HEADERS, stream=True, timeout=1000) as instance_response:
+                if latency is None:
+                    latency = instance_response.elapsed.total_seconds()
+                self._note_throttling(instance_response)
+                instance_response.raise_for_status()
+                size = self._write_response(instance_response, partial_file_path)
+
+        os.replace(partial_file_path, output_file_path)
+        return latency, size
+
+    def _note_throttling(self, response):
+        """
+        Tell the limiter when a response only succeeded after rate-limit retries.
+
+        Args:
+            response (requests.Response): The response to inspect.
+        """
+        retries = getattr(response.raw, "retries", None)
+        if retries is not None and any(entry.status in THROTTLE_STATUSES for entry in retries.history):
+            self.limiter.throttled()
+
+    def _parse_content_range(self, response):
+        """
+        Parse the Content-Range header of a partial response.
+
+        Args:
+            response (requests.Response): The response to inspect.
+
+        Returns:
+            tuple: The first byte, last byte and total size, or None if the response is not a
+            206 with a complete ``bytes start-end/total`` header.
+        """
+        if response.status_code != 206:
+            return None
+        match = _CONTENT_RANGE_RE.fullmatch(response.headers.get("Content-Range", ""))
+        if not match:
+            return None
+        return tuple(int(group) for group in match.groups())
+
+    def _write_response(self, response, output_file_path):
+        """
+        Stream a response body to a file.
+
+        Bodies of at least UNCACHED_WRITE_THRESHOLD bytes are written with os.write, as their pages
+        are dropped from the page cache once the instance is complete; smaller ones go through a
+        buffered file, where the cost of flushing them to disk would outweigh the cache they occupy.
+
+        Args:
+            response (requests.Response): The streamed response to write.
+            output_file_path (str): The path of the file to write.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        # iter_content undoes any Content-Encoding (e.g. gzip) so both paths write the DICOM bytes.
+        chunks = response.iter_content(STREAM_CHUNK_SIZE)
+        content_length = response.headers.get("Content-Length", "")
+        if not (hasattr(os, "posix_fadvise") and content_length.isdigit()
+                and int(content_length) >= UNCACHED_WRITE_THRESHOLD):
+            with open(output_file_path, "wb", buffering=STREAM_CHUNK_SIZE) as file:
+                for chunk in chunks:
+                    file.write(chunk)
+                return file.tell()
+
+        written = 0
+        fd = os.open(output_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            for chunk in chunks:
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(fd, view):]
+                written += len(chunk)
+        finally:
+            os.close(fd)
+        return written
+
+    def _release_page_cache(self, file_path):
+        """
+        Flush a fully written file and drop its pages from the page cache.
+
+        POSIX_FADV_DONTNEED only discards clean pages, so the file is synced first; this is done
+        once per file, after the last write.
+
+        Args:
+            file_path (str): The path of the written file.
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+    def _download_ranged(self, range_executor, instance_url, output_file_path, probe_response, probe_end, total):
+        """
+        Download an instance as parallel byte ranges into a pre-allocated file.
+
+        The probe response already covers bytes ``0..probe_end``; it is written on the calling
+        thread while the remaining ranges download on the range executor. Each extra connection
+        takes a permit from the limiter, and the rest is fetched as one range on the calling thread
+        when no permits are free.
+
+        Args:
+            range_executor (ThreadPoolExecutor): The executor to submit byte-range downloads to.
+            instance_url (str): The DICOMweb URL of the instance.
+            output_file_path (str): The path of the file to write.
+            probe_response (requests.Response): The streamed 206 response for the first range.
+            probe_end (int): The last byte covered by the probe response, inclusive.
+            total (int): The size of the instance in bytes.
+
+        Returns:
+            bool: True if every range was served, False if the caller should fall back to a single GET.
+        """
+        remaining_start = probe_end + 1
+        extra_permits = self.limiter.try_acquire(RANGED_DOWNLOAD_PARTS - 1)
+        fd = None
+        try:
+            fd = os.open(output_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            os.ftruncate(fd, total)
+            if not extra_permits:
+                return (
+                    self._write_range(probe_response, fd, 0, probe_end)
+                    and self._download_range(instance_url, fd, remaining_start, total - 1)
+                )
+            part_size = -(-(total - remaining_start) // extra_permits)
+            futures = []
+            try:
+                for start in range(remaining_start, total, part_size):
+                    futures.append(range_executor.submit(
+                        self._download_range, instance_url, fd, start,
+                        min(start + part_size, total) - 1
+                    ))
+                probe_written = self._write_range(probe_response, fd, 0, probe_end)
+            finally:
+                # Every range must finish before the descriptor is closed, even if one fails.
+                # exception() also returns for futures cancelled by an aborting download, which
+                # concurrent.futures.wait() would never be woken for.
+                for future in futures:
+                    try:
+                        future.exception()
+                    except CancelledError:
+                        pass
+                # The range connections are closed, so their permits are free again.
+                self.limiter.release(extra_permits)
+                extra_permits = 0
+            return probe_written and all(future.result() for future in futures)
+        finally:
+            if fd is not None:
+                os.close(fd)
+            self.limiter.release(extra_permits)
+
+    def _download_range(self, instance_url, fd, start, end):
+        """
+        Download one byte range of an instance and write it at its offset in the file.
+
+        Args:
+            instance_url (str): The DICOMweb URL of the instance.
+            fd (int): The file descriptor of the pre-allocated output file.
+            start (int): The first byte of the range.
+            end (int): The last byte of the range, inclusive.
+
+        Returns:
+            bool: True if the range was written, False if the server did not honour it.
+        """
+        if self._cancelled.is_set():
+            raise CancelledError()
+        range_headers = {**INSTANCE_HEADERS, "Range": f"bytes={start}-{end}"}
+        with self.session.get(instance_url, headers=range_headers, stream=True, timeout=1000) as range_response:
+            self._note_throttling(range_response)
+            if range_response.status_code >= 500:
+                range_response.raise_for_status()
+            content_range = self._parse_content_range(range_response)
+            if content_range is None or content_range[:2] != (start, end):
+                return False
+            return self._write_range(range_response, fd, start, end)
+
+    def _write_range(self, response, fd, start, end):
+        """
+        Write a partial response body at its offset in the file.
+
+        Args:
+            response (requests.Response): The streamed 206 response.
+            fd (int): The file descriptor of the pre-allocated output file.
+            start (int): The first byte of the range.
+            end (int): The last byte of the range, inclusive.
+
+        Returns:
+            bool: True if exactly the bytes of the range were received.
+        """
+        offset = start
+        for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+            if offset + len(chunk) > end + 1:
+                return False
+            os.pwrite(fd, chunk, offset)
+            offset += len(chunk)
+        return offset == end + 1
+
+    def _update_progress(self, completed, listed):
+        """
+        Set the progress bar value. Must be called on the Tk thread.
+
+        Args:
+            completed (int): The number of downloaded instances.
+            listed (int): The number of instances listed so far.
+        """
+        # A zero maximum is not a valid determinate range, so an empty listing shows as 0 of 1.
+        self.progress_bar["maximum"] = max(listed, 1)
+        self.progress_bar["value"] = completed
+        self.progress_bar.update_idletasks()
+
     def _get_access_tocken(self):
         """
-        Get the access token for the Google Cloud Healthcare API.
+        Get the access token for the Google Cloud Healthcare API, refreshing it only when
+        it is missing or about to expire.
 
         Returns:
             str: The access token.
         """
-        auth_request = Request()
-        self.credentials.refresh(auth_request)
-        access_token = self.credentials.token
+        with _TOKEN_LOCK:
+            # valid is False once the token is within google-auth's refresh threshold of expiry.
+            if not self.credentials.valid:
+                self.credentials.refresh(self._auth_request)
+            access_token = self.credentials.token
         return access_token
 
+    def _authorize(self, request):
+        """
+        Attach a current bearer token to an outgoing request. Installed as the session's auth
+        so long downloads pick up refreshed tokens.
+
+        Args:
+            request (requests.PreparedRequest): The request about to be sent.
+
+        Returns:
+            requests.PreparedRequest: The request with its Authorization header set.
+        """
+        request.headers["Authorization"] = f"Bearer {self._get_access_tocken()}"
+        return request
+
+class _AdaptiveLimiter:
+    """
+    A concurrency limit that adapts to observed server latency and byte throughput.
+
+    Latency is the time to response headers, so it does not grow with file size, and throughput
+    is measured in bytes per second. After every ADAPTIVE_WINDOW completed instances the limit
+    grows by ADAPTIVE_CONCURRENCY_STEP while throughput keeps rising, shrinks by the same step
+    when the average latency spikes above its best observed value, and is halved when the server
+    rate-limited any request in the window.
+
+    Attributes:
+        limit (int): The current number of connections allowed in flight.
+    """
+
+    def __init__(self, initial, minimum, maximum):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial (int): The starting concurrency limit.
+            minimum (int): The lowest limit the controller may back off to.
+            maximum (int): The highest limit the controller may grow to.
+        """
+        self.limit = initial
+        self._minimum = minimum
+        self._maximum = maximum
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._latency_ewma = None
+        self._best_latency = None
+        self._last_throughput = 0.0
+        self._window_count = 0
+        self._window_bytes = 0
+        self._window_throttled = False
+        self._window_start = time.monotonic()
+
+    def acquire(self):
+        """
+        Block until a connection may start under the current limit.
+        """
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+    def try_acquire(self, count):
+        """
+        Take up to ``count`` permits without blocking.
+
+        Args:
+            count (int): The number of permits wanted.
+
+        Returns:
+            int: The number of permits granted, possibly zero.
+        """
+        with self._condition:
+            granted = max(0, min(count, self.limit - self._in_flight))
+            self._in_flight += granted
+            return granted
+
+    def release(self, count=1):
+        """
+        Return permits and let waiting connections start.
+
+        Args:
+            count (int): The number of permits to return.
+        """
+        if not count:
+            return
+        with self._condition:
+            self._in_flight -= count
+            self._condition.notify_all()
+
+    def throttled(self):
+        """
+        Record that the server rate-limited a request in the current window.
+        """
+        with self._condition:
+            self._window_throttled = True
+
+    def record(self, latency, size):
+        """
+        Record a downloaded instance.
+
+        Args:
+            latency (float): The time to the first response's headers in seconds.
+            size (int): The instance size in bytes.
+        """
+        with self._condition:
+            if self._latency_ewma is None:
+                self._latency_ewma = latency
+            else:
+                self._latency_ewma = 0.2 * latency + 0.8 * self._latency_ewma
+            self._window_count += 1
+            self._window_bytes += size
+            if self._window_count >= ADAPTIVE_WINDOW:
+                self._adjust()
+                self._condition.notify_all()
+
+    def _adjust(self):
+        """
+        Resize the limit from the statistics of the window that just closed.
+        """
+        now = time.monotonic()
+        throughput = self._window_bytes / max(now - self._window_start, 1e-6)
+        if self._window_throttled:
+            self.limit = max(self._minimum, self.limit // 2)
+        elif (self._best_latency is not None
+              and self._latency_ewma > ADAPTIVE_LATENCY_SPIKE_FACTOR * self._best_latency):
+            self.limit = max(self._minimum, self.limit - ADAPTIVE_CONCURRENCY_STEP)
+        elif throughput > self._last_throughput:
+            self.limit = min(self._maximum, self.limit + ADAPTIVE_CONCURRENCY_STEP)
+
+        if self._best_latency is None or self._latency_ewma < self._best_latency:
+            self._best_latency = self._latency_ewma
+        self._last_throughput = throughput
+        self._window_count = 0
+        self._window_bytes = 0
+        self._window_throttled = False
+        self._window_start = now
+
 if __name__ == "__main__":
     root = tk.Tk()
     app = DicomDownloaderUI(root)